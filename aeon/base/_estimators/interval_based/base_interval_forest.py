@@ -714,8 +714,11 @@ class BaseIntervalForest(ABC):
         self._transformer_feature_names = [[]] * len(Xt)
         for r, att_subsample in enumerate(self._att_subsample_size):
             if att_subsample is not None:
+                num_features = 0
                 for transformer in self._interval_features[r]:
-                    if isinstance(transformer, BaseTransformer):
+                    if not isinstance(transformer, BaseTransformer):
+                        num_features += 1
+                    else:
                         params = inspect.signature(transformer.__init__).parameters
 
                         # the transformer must have a parameter with one of the
@@ -745,6 +748,7 @@ class BaseIntervalForest(ABC):
                             ):
                                 has_feature_names = True
                                 self._transformer_feature_names[r].append(n)
+                                num_features += len(getattr(transformer, n))
                                 break
 
                         if not has_feature_names:
@@ -755,6 +759,22 @@ class BaseIntervalForest(ABC):
                                 "subsampling."
                             )
 
+                # if the subsample size covers every attribute there is nothing to
+                # subsample, disable it here rather than checking for every tree
+                if isinstance(att_subsample, float):
+                    att_subsample = int(att_subsample * num_features)
+                if att_subsample >= num_features:
+                    # only warn if requested number of features is greater than actual
+                    if att_subsample > num_features:
+                        warnings.warn(
+                            f"Attribute subsample size {att_subsample} is "
+                            f"larger than the number of attributes {num_features} "
+                            f"for series {self._series_transformers[r]}",
+                            stacklevel=2,
+                        )
+
+                    self._att_subsample_size[r] = None
+
         # verify the interval_selection_method is a valid string
         if isinstance(self.interval_selection_method, str):
             # SupervisedIntervals cannot currently handle transformers or regression
@@ -797,6 +817,11 @@ class BaseIntervalForest(ABC):
             raise ValueError(f"Invalid replace_nan input. Found {self.replace_nan}")
 
         self._n_jobs = check_n_jobs(self.n_jobs)
+        self._parallel_backend = (
+            self._default_parallel_backend()
+            if self.parallel_backend is None
+            else self.parallel_backend
+        )
 
         if self.time_limit_in_minutes is not None and self.time_limit_in_minutes > 0:
             time_limit = self.time_limit_in_minutes * 60
@@ -808,42 +833,45 @@ class BaseIntervalForest(ABC):
             self.intervals_ = []
             transformed_intervals = []
 
-            while (
-                train_time < time_limit
-                and self._n_estimators < self.contract_max_n_estimators
-            ):
-                fit = Parallel(
-                    n_jobs=self._n_jobs,
-                    backend=self.parallel_backend,
-                    prefer="threads",
-                )(
-                    delayed(self._fit_estimator)(
-                        Xt,
-                        y,
-                        rng.randint(np.iinfo(np.int32).max),
-                        save_transformed_data=save_transformed_data,
+            # a single managed Parallel reuses its workers for every round, along with
+            # the memory-mapped copy of Xt joblib makes for process based backends
+            with Parallel(
+                n_jobs=self._n_jobs,
+                backend=self._parallel_backend,
+                prefer="threads",
+            ) as parallel:
+                while (
+                    train_time < time_limit
+                    and self._n_estimators < self.contract_max_n_estimators
+                ):
+                    fit = parallel(
+                        delayed(self._fit_estimator)(
+                            Xt,
+                            y,
+                            rng.randint(np.iinfo(np.int32).max),
+                            save_transformed_data=save_transformed_data,
+                        )
+                        for _ in range(self._n_jobs)
                     )
-                    for _ in range(self._n_jobs)
-                )
 
-                (
-                    estimators,
-                    intervals,
-                    td,
-                ) = zip(*fit)
+                    (
+                        estimators,
+                        intervals,
+                        td,
+                    ) = zip(*fit)
 
-                self.estimators_ += estimators
-                self.intervals_ += intervals
-                transformed_intervals += td
+                    self.estimators_ += estimators
+                    self.intervals_ += intervals
+                    transformed_intervals += td
 
-                self._n_estimators += self._n_jobs
-                train_time = time.time() - start_time
+                    self._n_estimators += self._n_jobs
+                    train_time = time.time() - start_time
         else:
             self._n_estimators = self.n_estimators
 
             fit = Parallel(
                 n_jobs=self._n_jobs,
-                backend=self.parallel_backend,
+                backend=self._parallel_backend,
                 prefer="threads",
             )(
                 delayed(self._fit_estimator)(
@@ -869,7 +897,7 @@ class BaseIntervalForest(ABC):
 
         intervals = []
         transform_data_lengths = []
-        interval_features = np.empty((self.n_cases_, 0))
+        interval_features = []
 
         # for each transformed series
         for r in range(len(Xt)):
@@ -899,71 +927,52 @@ class BaseIntervalForest(ABC):
                 if isinstance(self._att_subsample_size[r], float):
                     att_subsample_size = int(att_subsample_size * num_features)
 
-                # if the att_subsample_size is greater than the number of features
-                # give a warning and add all features
+                # subsample the transformer and function features by index, sizes
+                # which include every feature are disabled in fit
                 features = []
-                if att_subsample_size < num_features:
-                    # subsample the transformer and function features by index
-                    atts = rng.choice(
-                        num_features,
-                        att_subsample_size,
-                        replace=False,
+                atts = rng.choice(
+                    num_features,
+                    att_subsample_size,
+                    replace=False,
+                )
+                atts.sort()
+
+                # subsample the feature transformers using the
+                # transformer_feature_names and transformer_feature_selection
+                # attributes.
+                # the presence of valid attributes is verified in fit.
+                count = 0
+                length = 0
+                for n, transformer in enumerate(all_transformers):
+                    this_len = len(
+                        getattr(transformer, self._transformer_feature_names[r][n])
                     )
-                    atts.sort()
-
-                    # subsample the feature transformers using the
-                    # transformer_feature_names and transformer_feature_selection
-                    # attributes.
-                    # the presence of valid attributes is verified in fit.
-                    count = 0
-                    length = 0
-                    for n, transformer in enumerate(all_transformers):
-                        this_len = len(
-                            getattr(transformer, self._transformer_feature_names[r][n])
+                    length += this_len
+
+                    # subsample feature names from this transformer
+                    t_features = []
+                    while count < len(atts) and atts[count] < length:
+                        t_features.append(
+                            getattr(
+                                transformer,
+                                self._transformer_feature_names[r][n],
+                            )[atts[count] + this_len - length]
                         )
-                        length += this_len
-
-                        # subsample feature names from this transformer
-                        t_features = []
-                        while count < len(atts) and atts[count] < length:
-                            t_features.append(
-                                getattr(
-                                    transformer,
-                                    self._transformer_feature_names[r][n],
-                                )[atts[count] + this_len - length]
-                            )
-                            count += 1
-
-                        # tell this transformer to only transform the selected features
-                        if len(t_features) > 0:
-                            new_transformer = _clone_estimator(transformer, seed)
-                            setattr(
-                                new_transformer,
-                                self._transformer_feature_selection[r][n],
-                                t_features,
-                            )
-                            features.append(new_transformer)
-
-                    # subsample the remaining function features
-                    for i in range(att_subsample_size - count):
-                        features.append(all_function_features[atts[count + i] - length])
-                else:
-                    # only warn if requested number of features is greater than actual
-                    if att_subsample_size > num_features:
-                        warnings.warn(
-                            f"Attribute subsample size {att_subsample_size} is "
-                            f"larger than the number of attributes {num_features} "
-                            f"for series {self._series_transformers[r]}",
-                            stacklevel=2,
+                        count += 1
+
+                    # tell this transformer to only transform the selected features
+                    if len(t_features) > 0:
+                        new_transformer = _clone_estimator(transformer, seed)
+                        setattr(
+                            new_transformer,
+                            self._transformer_feature_selection[r][n],
+                            t_features,
                         )
+                        features.append(new_transformer)
 
-                    self._att_subsample_size[r] = None
-
-                    for feature in self._interval_features[r]:
-                        if isinstance(feature, BaseTransformer):
-                            features.append(_clone_estimator(feature, seed))
-                        else:
-                            features.append(feature)
+                # subsample the remaining function features
+                for i in range(att_subsample_size - count):
+                    features.append(all_function_features[atts[count + i] - length])
             # add all features while cloning estimators if not subsampling
             else:
                 features = []
@@ -1004,9 +1013,16 @@ class BaseIntervalForest(ABC):
             intervals.append(selector)
             f = intervals[r].fit_transform(Xt[r], y)
 
-            # concatenate the data and save this transforms number of attributes
+            # save the data and this transforms number of attributes
             transform_data_lengths.append(f.shape[1])
-            interval_features = np.hstack((interval_features, f))
+            interval_features.append(f)
+
+        # concatenate once, avoiding a copy when there is only a single series
+        interval_features = (
+            interval_features[0]
+            if len(interval_features) == 1
+            else np.hstack(interval_features)
+        )
 
         if isinstance(self.replace_nan, str) and self.replace_nan.lower() == "nan":
             interval_features = np.nan_to_num(
@@ -1062,6 +1078,13 @@ class BaseIntervalForest(ABC):
             interval_features if save_transformed_data else None,
         ]
 
+    def _default_parallel_backend(self):
+        # joblib backend used to fit the forest when parallel_backend is None, None
+        # lets joblib pick using the "threads" preference. predictions always use
+        # parallel_backend, as process based backends would pickle the fitted forest
+        # for every batch
+        return None
+
     def _predict_setup(self, X):
         Xt = []
         for transformer in self._series_transformers:
@@ -1073,11 +1096,12 @@ class BaseIntervalForest(ABC):
         return Xt
 
     def _predict_for_estimator(self, Xt, estimator, intervals, predict_proba=False):
-        interval_features = np.empty((Xt[0].shape[0], 0))
-
-        for r in range(len(Xt)):
-            f = intervals[r].transform(Xt[r])
-            interval_features = np.hstack((interval_features, f))
+        interval_features = [intervals[r].transform(Xt[r]) for r in range(len(Xt))]
+        interval_features = (
+            interval_features[0]
+            if len(interval_features) == 1
+            else np.hstack(interval_features)
+        )
 
         if isinstance(self.replace_nan, str) and self.replace_nan.lower() == "nan":
             interval_features = np.nan_to_num(
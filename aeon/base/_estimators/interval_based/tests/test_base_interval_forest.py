@@ -148,6 +148,50 @@ def test_interval_forest_attribute_subsample(features, output_len):
     assert est._transformed_data[0].shape[1] == int(output_len * 0.5) * 2
 
 
+@pytest.mark.parametrize("att_subsample_size", [4, 1.0, 6])
+def test_interval_forest_full_attribute_subsample(att_subsample_size):
+    """Test BaseIntervalForest disables subsampling when it covers all attributes."""
+    X, y = make_example_3d_numpy()
+
+    est = IntervalForestClassifier(
+        n_estimators=2,
+        n_intervals=2,
+        att_subsample_size=att_subsample_size,
+        interval_features=[row_mean, _clone_estimator(att_subsample_c22)],
+        replace_nan=0,
+        random_state=0,
+    )
+    est.__unit_test_flag = True
+
+    if att_subsample_size == 6:
+        with pytest.warns(UserWarning, match="larger than the number of attributes"):
+            est.fit(X, y)
+    else:
+        est.fit(X, y)
+
+    assert est._att_subsample_size == [None]
+    assert est._transformed_data[0].shape[1] == 8
+
+
+def test_interval_forest_contract_n_jobs():
+    """Test BaseIntervalForest contracting with multiple jobs."""
+    X, y = make_example_3d_numpy()
+
+    est = IntervalForestClassifier(
+        n_intervals=2,
+        time_limit_in_minutes=1,
+        contract_max_n_estimators=4,
+        random_state=0,
+        n_jobs=2,
+        parallel_backend="loky",
+    )
+    est.fit(X, y)
+
+    assert est._n_estimators == 4
+    assert len(est.estimators_) == 4
+    assert est.predict_proba(X).shape == (X.shape[0], est.n_classes_)
+
+
 def test_interval_forest_invalid_attribute_subsample():
     """Test BaseIntervalForest with an invalid transformer for subsampling."""
     X, y = make_example_3d_numpy()
@@ -4,11 +4,15 @@ __maintainer__ = ["MatthewMiddlehurst"]
 __all__ = ["RegressorEnsemble"]
 
 
+from functools import lru_cache
+
 import numpy as np
+from joblib import Parallel, delayed
 
 from aeon.base._estimators.compose.collection_ensemble import BaseCollectionEnsemble
 from aeon.regression import BaseRegressor
 from aeon.regression.sklearn._wrapper import SklearnRegressorWrapper
+from aeon.utils.conversion import convert_collection
 from aeon.utils.sklearn import is_sklearn_regressor
 
 
@@ -44,6 +48,14 @@ class RegressorEnsemble(BaseCollectionEnsemble, BaseRegressor):
         ensemble members (but they may still be seeded prior to input).
         If `int`, random_state is the seed used by the random number generator;
         If `RandomState` instance, random_state is the random number generator;
+    n_jobs : int, default=1
+        The number of jobs to run in parallel for `predict`, with each job making
+        predictions for a single ensemble member. ``-1`` means using all processors.
+    parallel_backend : str, ParallelBackendBase instance or None, default=None
+        Specify the parallelisation backend implementation in joblib, if None a 'prefer'
+        value of "threads" is used by default.
+        Valid options are "loky", "multiprocessing", "threading" or a custom backend.
+        See the joblib Parallel documentation for more details.
 
     Attributes
     ----------
@@ -60,6 +72,7 @@ class RegressorEnsemble(BaseCollectionEnsemble, BaseRegressor):
 
     _tags = {
         "X_inner_type": ["np-list", "numpy3D"],
+        "capability:multithreading": True,
     }
 
     def __init__(
@@ -69,8 +82,12 @@ class RegressorEnsemble(BaseCollectionEnsemble, BaseRegressor):
         cv=None,
         metric=None,
         random_state=None,
+        n_jobs=1,
+        parallel_backend=None,
     ):
         self.regressors = regressors
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
         wreg = [self._wrap_sklearn(clf) for clf in self.regressors]
 
@@ -84,23 +101,102 @@ class RegressorEnsemble(BaseCollectionEnsemble, BaseRegressor):
             _ensemble_input_name="regressors",
         )
 
+        # unique names are only assigned once the base class has processed the
+        # input, ensemble_ keeps the same names and order after fitting
+        self._names = [name for name, _ in self._ensemble]
+        self._name_to_idx = {name: i for i, name in enumerate(self._names)}
+
+    def _fit(self, X, y):
+        super()._fit(X, y)
+
+        # cache the ensemble weights in ensemble_ order, normalised once so
+        # _predict can combine member predictions with a single product
+        self._w_arr = np.empty(len(self._names))
+        for name, weight in self.weights_.items():
+            self._w_arr[self._name_to_idx[name]] = weight
+        self._w_norm = self._w_arr / self._w_arr.sum()
+        self._uniform_weights = bool(np.all(self._w_arr == self._w_arr[0]))
+
+        return self
+
     def _predict(self, X) -> np.ndarray:
         """Predicts labels for sequences in X."""
-        preds = np.zeros(len(X))
+        preds = self._predict_members(X)
+
+        # equal weights are the common case, skip the weighting entirely
+        if self._uniform_weights:
+            return np.mean(preds, axis=0)
+        return self._w_norm @ preds
+
+    def predict_running(self, X) -> np.ndarray:
+        """Predicts target variable using the first k ensemble members for each k.
+
+        Useful for deciding how many ensemble members are worth keeping without
+        refitting, as all partial predictions are made from a single set of member
+        predictions.
+
+        Parameters
+        ----------
+        X : np.ndarray or list
+            Input data of the same format as accepted by ``predict``.
+
+        Returns
+        -------
+        predictions : np.ndarray
+            2D np.array of float, of shape ``(n_estimators, n_cases)``. Row k is the
+            weighted mean prediction of the first k + 1 members of ``ensemble_``, with
+            the last row equal to the output of ``predict``. Rows where the first
+            k + 1 members all have zero weight use the unweighted mean of their
+            predictions instead.
+        """
+        self._check_is_fitted()
+        X = self._preprocess_collection(X, store_metadata=False)
+        self._check_shape(X)
+
+        preds = self._predict_members(X)
+        running = np.cumsum(self._w_arr[:, np.newaxis] * preds, axis=0)
+        cum_w = np.cumsum(self._w_arr)
+        cum_w = cum_w[:, np.newaxis]
+        np.divide(running, cum_w, out=running, where=cum_w > 0)
+
+        zero_w = cum_w[:, 0] == 0
+        if zero_w.any():
+            counts = np.arange(1, len(preds) + 1)[zero_w, np.newaxis]
+            running[zero_w] = np.cumsum(preds, axis=0)[zero_w] / counts
+        return running
+
+    def _predict_members(self, X) -> np.ndarray:
+        # convert X once here rather than in the predict of every member
+        if isinstance(X, np.ndarray):
+            X = np.ascontiguousarray(X)
+        elif len({x.shape for x in X}) == 1:
+            X = convert_collection(X, "numpy3D")
+
+        preds = np.empty((len(self.ensemble_), len(X)))
+
+        # fill the output directly when running serially, process based backends
+        # cannot write to it so parallel predictions are gathered first
+        if self._n_jobs == 1:
+            for i, (_, reg) in enumerate(self.ensemble_):
+                preds[i] = reg.predict(X=X)
+        else:
+            member_preds = Parallel(
+                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+            )(delayed(reg.predict)(X=X) for _, reg in self.ensemble_)
 
-        for reg_name, reg in self.ensemble_:
-            preds += reg.predict(X=X) * self.weights_[reg_name]
+            for i, p in enumerate(member_preds):
+                preds[i] = p
 
-        return preds / np.sum(list(self.weights_.values()))
+        return preds
 
     @staticmethod
     def _wrap_sklearn(reg):
         if isinstance(reg, tuple):
-            if is_sklearn_regressor(reg[1]):
+            if _needs_wrap(reg[1]):
                 return reg[0], SklearnRegressorWrapper(reg[1])
             else:
                 return reg
-        elif is_sklearn_regressor(reg):
+        elif _needs_wrap(reg):
             return SklearnRegressorWrapper(reg)
         else:
             return reg
@@ -132,3 +228,16 @@ class RegressorEnsemble(BaseCollectionEnsemble, BaseRegressor):
             ],
             "weights": [2, 1],
         }
+
+
+def _needs_wrap(reg):
+    # sklearn pipelines and search objects are identified by the estimator they
+    # contain, so only the type of other estimators can be cached
+    if hasattr(reg, "steps") or hasattr(reg, "estimator"):
+        return is_sklearn_regressor(reg)
+    return _is_sklearn_regressor_cls(type(reg))
+
+
+@lru_cache(maxsize=None)
+def _is_sklearn_regressor_cls(cls):
+    return is_sklearn_regressor(cls)
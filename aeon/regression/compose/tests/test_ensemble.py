@@ -2,14 +2,20 @@
 
 __maintainer__ = ["MatthewMiddlehurst"]
 
+import warnings
+
 import numpy as np
 import pytest
 from sklearn.dummy import DummyRegressor as SklearnDummyRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error
 from sklearn.model_selection import KFold
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
 
 from aeon.regression import DummyRegressor
 from aeon.regression.compose._ensemble import RegressorEnsemble
+from aeon.regression.distance_based import KNeighborsTimeSeriesRegressor
+from aeon.regression.sklearn import SklearnRegressorWrapper
 from aeon.testing.data_generation import (
     make_example_3d_numpy,
     make_example_3d_numpy_list,
@@ -80,6 +86,117 @@ def test_regressor_ensemble_weights(weights):
     assert isinstance(y_pred, np.ndarray)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize(
+    "weights", [[1, 1, 1], [0.5, 1, 2], [1e-9, 5e-9, 2e-9], [1.0, 1.000001, 1.0]]
+)
+def test_regressor_ensemble_weighted_average(n_jobs, weights):
+    """Test regressor ensemble predictions are the weighted mean of its members."""
+    X_train, y_train = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+    X_test, _ = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+
+    ensemble = RegressorEnsemble(
+        regressors=mixed_ensemble, weights=weights, n_jobs=n_jobs
+    )
+    ensemble.fit(X_train, y_train)
+
+    member_preds = np.array([reg.predict(X_test) for _, reg in ensemble.ensemble_])
+    expected = np.average(member_preds, axis=0, weights=weights)
+    np.testing.assert_allclose(ensemble.predict(X_test), expected)
+    assert ensemble._uniform_weights == (len(set(weights)) == 1)
+
+
+def test_regressor_ensemble_normalised_weights():
+    """Test regressor ensemble normalises its weights once in fit."""
+    X_train, y_train = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+    X_test, _ = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+
+    ensemble = RegressorEnsemble(regressors=mixed_ensemble, weights=[0.5, 1, 2])
+    ensemble.fit(X_train, y_train)
+
+    np.testing.assert_allclose(ensemble._w_norm, [0.5 / 3.5, 1 / 3.5, 2 / 3.5])
+
+    # predict uses the weights cached in fit rather than weights_
+    y_pred = ensemble.predict(X_test)
+    ensemble.weights_ = None
+    np.testing.assert_array_equal(ensemble.predict(X_test), y_pred)
+
+
+def test_regressor_ensemble_running_predictions():
+    """Test regressor ensemble predictions using the first k members."""
+    X_train, y_train = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+    X_test, _ = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+
+    weights = [0.5, 1, 2]
+    ensemble = RegressorEnsemble(regressors=mixed_ensemble, weights=weights)
+    ensemble.fit(X_train, y_train)
+    running = ensemble.predict_running(X_test)
+
+    assert running.shape == (3, 10)
+    member_preds = np.array([reg.predict(X_test) for _, reg in ensemble.ensemble_])
+    for k in range(1, 4):
+        expected = np.average(member_preds[:k], axis=0, weights=weights[:k])
+        np.testing.assert_allclose(running[k - 1], expected)
+    np.testing.assert_allclose(running[-1], ensemble.predict(X_test))
+
+
+def test_regressor_ensemble_running_predictions_zero_weights():
+    """Test running predictions are finite when the leading weights are zero."""
+    X_train, y_train = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+    X_test, _ = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+
+    weights = [0, 0, 2]
+    ensemble = RegressorEnsemble(regressors=mixed_ensemble, weights=weights)
+    ensemble.fit(X_train, y_train)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        running = ensemble.predict_running(X_test)
+
+    assert np.all(np.isfinite(running))
+    member_preds = np.array([reg.predict(X_test) for _, reg in ensemble.ensemble_])
+    np.testing.assert_allclose(running[0], member_preds[0])
+    np.testing.assert_allclose(running[1], member_preds[:2].mean(axis=0))
+    np.testing.assert_allclose(running[2], ensemble.predict(X_test))
+
+
+def test_regressor_ensemble_predict_input_conversion():
+    """Test equal length np-list and non-contiguous input give the same result."""
+    X_train, y_train = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+    X_test, _ = make_example_3d_numpy(
+        n_cases=10, n_timepoints=12, regression_target=True
+    )
+
+    ensemble = RegressorEnsemble(
+        regressors=[KNeighborsTimeSeriesRegressor(n_neighbors=2), DummyRegressor()],
+        weights=[1, 2],
+    )
+    ensemble.fit(X_train, y_train)
+    y_pred = ensemble.predict(X_test)
+
+    np.testing.assert_array_equal(ensemble.predict(list(X_test)), y_pred)
+    X_nc = np.asfortranarray(X_test)
+    assert not X_nc.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(ensemble.predict(X_nc), y_pred)
+
+
 @pytest.mark.parametrize(
     "cv",
     [2, KFold(n_splits=2)],
@@ -108,6 +225,22 @@ def test_regressor_ensemble_learned_weights(cv, metric):
     assert isinstance(y_pred, np.ndarray)
 
 
+def test_regressor_ensemble_sklearn_wrapping():
+    """Test sklearn regressors are wrapped, including inside composite estimators."""
+    pipe = make_pipeline(StandardScaler(), SklearnDummyRegressor())
+    ensemble = RegressorEnsemble(
+        regressors=[
+            SklearnDummyRegressor(),
+            ("pipe", pipe),
+            DummyRegressor(),
+            make_pipeline(StandardScaler()),
+        ]
+    )
+
+    wrapped = [isinstance(e, SklearnRegressorWrapper) for _, e in ensemble._ensemble]
+    assert wrapped == [True, True, False, False]
+
+
 def test_unequal_tag_inference():
     """Test that RegressorEnsemble infers unequal length tag correctly."""
     X, y = make_example_3d_numpy_list(
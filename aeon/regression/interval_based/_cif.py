@@ -94,8 +94,10 @@ class CanonicalIntervalForestRegressor(BaseIntervalForest, BaseRegressor):
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
     parallel_backend : str, ParallelBackendBase instance or None, default=None
-        Specify the parallelisation backend implementation in joblib, if None a 'prefer'
-        value of "threads" is used by default.
+        Specify the parallelisation backend implementation in joblib, if None
+        ``fit`` uses "threading" when ``use_pycatch22=True`` and "loky" otherwise, as
+        the numba catch22 implementation holds the GIL so threads give little speedup
+        for it. Other methods use a 'prefer' value of "threads" if None.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
 
@@ -202,6 +204,9 @@ class CanonicalIntervalForestRegressor(BaseIntervalForest, BaseRegressor):
     def _fit_predict(self, X, y) -> np.ndarray:
         return super()._fit_predict(X, y)
 
+    def _default_parallel_backend(self):
+        return "threading" if self.use_pycatch22 else "loky"
+
     @classmethod
     def _get_test_params(cls, parameter_set="default"):
         """Return testing parameter settings for the estimator.
@@ -1,7 +1,10 @@
 """Test interval forest regressors."""
 
+import numpy as np
 import pytest
+from joblib import Parallel
 
+from aeon.base._estimators.interval_based import base_interval_forest
 from aeon.regression.interval_based import (
     CanonicalIntervalForestRegressor,
     DrCIFRegressor,
@@ -50,3 +53,51 @@ def test_forest_pycatch22(cls):
     reg.fit(X_train, y_train)
     prob = reg.predict(X_test)
     _assert_predict_labels(prob, X_test)
+
+
+def test_cif_default_parallel_backend(monkeypatch):
+    """Test CIF selects its fit joblib backend from the catch22 implementation."""
+    X_train, y_train = EQUAL_LENGTH_UNIVARIATE_REGRESSION["numpy3D"]["train"]
+    X_test, _ = EQUAL_LENGTH_UNIVARIATE_REGRESSION["numpy3D"]["test"]
+
+    params = CanonicalIntervalForestRegressor._get_test_params()
+
+    reg = CanonicalIntervalForestRegressor(**params, random_state=0)
+    reg.fit(X_train, y_train)
+    assert reg._parallel_backend == "loky"
+    assert reg.parallel_backend is None
+
+    reg_mt = CanonicalIntervalForestRegressor(**params, random_state=0, n_jobs=2)
+    reg_mt.fit(X_train, y_train)
+
+    # predictions keep the "threads" preference rather than the fit backend
+    backends = []
+
+    def _parallel(*args, **kwargs):
+        backends.append(kwargs["backend"])
+        return Parallel(*args, **kwargs)
+
+    monkeypatch.setattr(base_interval_forest, "Parallel", _parallel)
+    np.testing.assert_array_almost_equal(reg.predict(X_test), reg_mt.predict(X_test))
+    assert backends == [None, None]
+
+    reg = CanonicalIntervalForestRegressor(use_pycatch22=True)
+    assert reg._default_parallel_backend() == "threading"
+
+
+def test_cif_float32_input():
+    """Test CIF accepts single precision input without changing predictions."""
+    X_train, y_train = EQUAL_LENGTH_UNIVARIATE_REGRESSION["numpy3D"]["train"]
+    X_test, _ = EQUAL_LENGTH_UNIVARIATE_REGRESSION["numpy3D"]["test"]
+
+    params = CanonicalIntervalForestRegressor._get_test_params()
+
+    reg = CanonicalIntervalForestRegressor(**params, random_state=0)
+    reg.fit(X_train, y_train)
+
+    reg32 = CanonicalIntervalForestRegressor(**params, random_state=0)
+    reg32.fit(X_train.astype(np.float32), y_train)
+
+    np.testing.assert_array_almost_equal(
+        reg.predict(X_test), reg32.predict(X_test.astype(np.float32)), decimal=4
+    )
@@ -8,19 +8,25 @@ __all__ = ["RandomIntervals"]
 
 import numpy as np
 from joblib import Parallel, delayed
+from numba import njit
 from sklearn.utils import check_random_state
 
 from aeon.base._base import _clone_estimator
 from aeon.transformations.base import BaseTransformer
 from aeon.transformations.collection.base import BaseCollectionTransformer
 from aeon.utils.numba.stats import (
+    mean,
+    mean_std_slope,
     row_mean,
     row_median,
     row_numba_max,
     row_numba_min,
     row_quantile25,
     row_quantile75,
+    row_slope,
     row_std,
+    slope,
+    std,
 )
 from aeon.utils.validation import check_n_jobs
 
@@ -176,12 +182,10 @@ class RandomIntervals(BaseCollectionTransformer):
             else:
                 removed_idx.append(i)
 
-        Xt = transformed_intervals[0]
-        for i in range(1, self.n_intervals):
-            if i not in removed_idx:
-                Xt = np.hstack((Xt, transformed_intervals[i]))
-
-        return Xt
+        removed_idx = set(removed_idx)
+        return np.hstack(
+            [t for i, t in enumerate(transformed_intervals) if i not in removed_idx]
+        )
 
     def _fit(self, X, y=None):
         X, rng = self._fit_setup(X)
@@ -232,7 +236,37 @@ class RandomIntervals(BaseCollectionTransformer):
                         transform_features.append(self._transform_features[count])
                         count += 1
 
-        transform = Parallel(
+        # basic summary statistic functions are extracted for all intervals in a
+        # single numba call rather than being dispatched one interval at a time.
+        # features sharing an interval slice are computed from a single read of it
+        batch_idx = []
+        batch_pos = []
+        slices = {}
+        other_idx = []
+        for i, interval in enumerate(self.intervals_):
+            code = _batch_feature_code(interval[3])
+            if code >= 0 and transform_features[i] is not False:
+                key = (interval[0], interval[1], interval[2], interval[4])
+                if key not in slices:
+                    slices[key] = len(slices)
+                batch_idx.append(i)
+                batch_pos.append((slices[key], code))
+            else:
+                other_idx.append(i)
+
+        transform = [None] * len(self.intervals_)
+        if len(batch_idx) > 0:
+            intervals = np.array(list(slices.keys()), dtype=np.int64)
+            required = np.zeros((len(slices), len(_BATCH_FEATURES)), dtype=np.bool_)
+            for k, code in batch_pos:
+                required[k, code] = True
+
+            Xt_batch = _transform_batch_features(X, intervals, required)
+
+            for i, (k, code) in zip(batch_idx, batch_pos):
+                transform[i] = Xt_batch[:, k, code : code + 1]
+
+        other_transform = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
         )(
             delayed(self._transform_interval)(
@@ -240,14 +274,12 @@ class RandomIntervals(BaseCollectionTransformer):
                 i,
                 transform_features[i],
             )
-            for i in range(len(self.intervals_))
+            for i in other_idx
         )
+        for n, i in enumerate(other_idx):
+            transform[i] = other_transform[n]
 
-        Xt = transform[0]
-        for i in range(1, len(self.intervals_)):
-            Xt = np.hstack((Xt, transform[i]))
-
-        return Xt
+        return np.hstack(transform)
 
     def _fit_setup(self, X):
         self.intervals_ = []
@@ -312,7 +344,9 @@ class RandomIntervals(BaseCollectionTransformer):
     def _generate_interval(self, X, y, seed, transform):
         rng = check_random_state(seed)
 
-        dim = rng.randint(self.n_channels_)
+        # randint(1) does not advance the generator, so skipping it for univariate
+        # data keeps the sampled intervals unchanged
+        dim = rng.randint(self.n_channels_) if self.n_channels_ > 1 else 0
 
         if rng.random() < 0.5:
             interval_start = (
@@ -352,7 +386,7 @@ class RandomIntervals(BaseCollectionTransformer):
         while interval_length / dilation < self._min_interval_length:
             dilation -= 1
 
-        Xt = np.empty((self.n_cases_, 0)) if transform else None
+        Xt = [] if transform else None
         intervals = []
 
         for feature in self._features:
@@ -373,7 +407,7 @@ class RandomIntervals(BaseCollectionTransformer):
                     if t.ndim == 3 and t.shape[1] == 1:
                         t = t.reshape((t.shape[0], t.shape[2]))
 
-                    Xt = np.hstack((Xt, t))
+                    Xt.append(t)
                 else:
                     feature.fit(
                         np.expand_dims(
@@ -382,14 +416,14 @@ class RandomIntervals(BaseCollectionTransformer):
                         y,
                     )
             elif transform:
-                t = [
-                    [f]
-                    for f in feature(X[:, dim, interval_start:interval_end:dilation])
-                ]
-                Xt = np.hstack((Xt, t))
+                t = feature(X[:, dim, interval_start:interval_end:dilation])
+                Xt.append(np.reshape(t, (-1, 1)))
 
             intervals.append((interval_start, interval_end, dim, feature, dilation))
 
+        if transform:
+            Xt = np.hstack(Xt) if len(Xt) > 0 else np.empty((self.n_cases_, 0))
+
         return intervals, Xt
 
     def _transform_interval(self, X, idx, keep_transform):
@@ -402,7 +436,7 @@ class RandomIntervals(BaseCollectionTransformer):
                         setattr(feature, n, keep_transform)
                         break
             elif not keep_transform:
-                return [[0] for _ in range(X.shape[0])]
+                return np.zeros((X.shape[0], 1))
 
         if isinstance(feature, BaseTransformer):
             Xt = feature.transform(
@@ -412,7 +446,9 @@ class RandomIntervals(BaseCollectionTransformer):
             if Xt.ndim == 3:
                 Xt = Xt.reshape((Xt.shape[0], Xt.shape[2]))
         else:
-            Xt = [[f] for f in feature(X[:, dim, interval_start:interval_end:dilation])]
+            Xt = np.reshape(
+                feature(X[:, dim, interval_start:interval_end:dilation]), (-1, 1)
+            )
 
         return Xt
 
@@ -496,3 +532,37 @@ class RandomIntervals(BaseCollectionTransformer):
             return {"n_intervals": 3}
         else:
             return {"n_intervals": 2}
+
+
+# feature functions which can be extracted using _transform_batch_features, the
+# index of each function is the code used to identify it in the numba function
+_BATCH_FEATURES = (row_mean, row_std, row_slope)
+
+
+def _batch_feature_code(feature):
+    for i, f in enumerate(_BATCH_FEATURES):
+        if feature is f:
+            return i
+    return -1
+
+
+@njit(fastmath=True, cache=True)
+def _transform_batch_features(X, intervals, required):
+    n_cases = X.shape[0]
+    Xt = np.zeros((n_cases, intervals.shape[0], 3))
+
+    for k in range(intervals.shape[0]):
+        start, end, dim, dilation = intervals[k]
+        n_required = required[k, 0] + required[k, 1] + required[k, 2]
+        for i in range(n_cases):
+            x = X[i, dim, start:end:dilation]
+            if n_required > 1:
+                Xt[i, k, 0], Xt[i, k, 1], Xt[i, k, 2] = mean_std_slope(x)
+            elif required[k, 0]:
+                Xt[i, k, 0] = mean(x)
+            elif required[k, 1]:
+                Xt[i, k, 1] = std(x)
+            else:
+                Xt[i, k, 2] = slope(x)
+
+    return Xt
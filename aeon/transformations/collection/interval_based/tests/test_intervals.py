@@ -1,12 +1,16 @@
 """Interval extraction test code."""
 
+import numba
+import numpy as np
+from joblib import Parallel, delayed
+
 from aeon.testing.data_generation import make_example_3d_numpy
 from aeon.transformations.collection.feature_based import Catch22, SevenNumberSummary
 from aeon.transformations.collection.interval_based import (
     RandomIntervals,
     SupervisedIntervals,
 )
-from aeon.utils.numba.stats import row_mean, row_median
+from aeon.utils.numba.stats import row_mean, row_median, row_slope, row_std
 
 
 def test_interval_prune():
@@ -39,6 +43,46 @@ def test_random_interval_transformer():
     assert rit.transform(X).shape == (10, 35)
 
 
+def test_random_interval_batch_features():
+    """Test batch extracted features in transform match those extracted in fit."""
+    X, y = make_example_3d_numpy(random_state=0, n_channels=2, n_timepoints=20)
+
+    rit = RandomIntervals(
+        features=[row_mean, row_median, row_std, row_slope],
+        n_intervals=5,
+        dilation=[1, 2],
+        random_state=0,
+    )
+    X_t = rit.fit_transform(X, y)
+
+    np.testing.assert_allclose(rit.transform(X), X_t, atol=1e-10)
+
+    # features set to skip in transform are not extracted
+    rit.set_features_to_transform([i % 4 != 2 for i in range(X_t.shape[1])])
+    X_t2 = rit.transform(X)
+    assert np.all(X_t2[:, 2::4] == 0)
+    np.testing.assert_allclose(X_t2[:, 3::4], X_t[:, 3::4], atol=1e-10)
+
+
+def test_random_interval_batch_features_threads():
+    """Test batch features work when transform is called from worker threads."""
+    X, y = make_example_3d_numpy(random_state=0, n_channels=2, n_timepoints=20)
+
+    rit = RandomIntervals(
+        features=[row_mean, row_std, row_slope],
+        n_intervals=5,
+        random_state=0,
+        n_jobs=numba.config.NUMBA_NUM_THREADS + 1,
+    )
+    X_t = rit.fit_transform(X, y)
+
+    X_t_threads = Parallel(n_jobs=2, backend="threading")(
+        delayed(rit.transform)(X) for _ in range(4)
+    )
+    for X_t_thread in X_t_threads:
+        np.testing.assert_allclose(X_t_thread, X_t, atol=1e-10)
+
+
 def test_supervised_transformers():
     """Test the SupervisedIntervals transformer output."""
     X, y = make_example_3d_numpy(random_state=0)
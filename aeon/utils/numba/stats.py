@@ -25,6 +25,7 @@ __all__ = [
     "row_numba_max",
     "slope",
     "row_slope",
+    "mean_std_slope",
     "iqr",
     "row_iqr",
     "ppv",
@@ -672,6 +673,58 @@ def row_slope(X: np.ndarray) -> np.ndarray:
     return arr
 
 
+@njit(fastmath=True, cache=True)
+def mean_std_slope(X: np.ndarray) -> tuple[float, float, float]:
+    """Numba mean, standard deviation and slope function for a 1d numpy array.
+
+    Computes the sums for the mean and slope in a single pass over the array, then
+    the variance around the mean in a second pass while the array is still in cache.
+    The results are the same as those from the mean, std and slope functions.
+
+    Parameters
+    ----------
+    X : 1d numpy array
+        A 1d numpy array of values
+
+    Returns
+    -------
+    m : float
+        The mean of the input array
+    s : float
+        The standard deviation of the input array
+    sl : float
+        The slope of the input array
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.utils.numba.stats import mean_std_slope
+    >>> X = np.array([1, 2, 2, 3, 3, 3, 4, 4, 4, 4])
+    >>> m, s, sl = mean_std_slope(X)
+    """
+    n = X.shape[0]
+    sum_y = 0
+    sum_x = 0
+    sum_xx = 0
+    sum_xy = 0
+    for i in range(n):
+        sum_y += X[i]
+        sum_x += i
+        sum_xx += i * i
+        sum_xy += X[i] * i
+    m = sum_y / n
+
+    s = 0
+    for i in range(n):
+        s += (X[i] - m) ** 2
+
+    sl = sum_x * sum_y - n * sum_xy
+    denom = sum_x * sum_x - n * sum_xx
+
+    sl = 0 if denom == 0 else sl / denom
+    return m, (s / n) ** 0.5, sl
+
+
 @njit(fastmath=True, cache=True)
 def iqr(X: np.ndarray) -> float:
     """Numba interquartile range function for a 1d numpy array.
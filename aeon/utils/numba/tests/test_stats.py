@@ -3,9 +3,16 @@
 __maintainer__ = []
 
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 
-from aeon.utils.numba.stats import is_prime, prime_up_to
+from aeon.utils.numba.stats import (
+    is_prime,
+    mean,
+    mean_std_slope,
+    prime_up_to,
+    slope,
+    std,
+)
 
 
 def test_prime_up_to():
@@ -75,3 +82,16 @@ def test_is_prime():
             assert is_prime(n)
         else:
             assert not is_prime(n)
+
+
+def test_mean_std_slope():
+    """Test the fused statistics match the individual functions."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(10, 25)) * 100 + 50
+    X[0] = 3.0
+
+    for x in X:
+        assert_allclose(mean_std_slope(x), [mean(x), std(x), slope(x)])
+
+    # a single value has no slope
+    assert_array_equal(mean_std_slope(np.array([2.0])), [2.0, 0.0, 0.0])